@@ -0,0 +1,192 @@
+import copy
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, Optional, cast
+
+import pytest
+from unittest.mock import MagicMock, create_autospec, patch
+
+from llama_index.core.query_pipeline import QueryPipeline
+from llama_index.core.query_pipeline.query import RunState
+
+from llama_agents.orchestrators.pipeline import (
+    get_service_component_message,
+    process_component_output,
+)
+from llama_agents.tools.service_component import ModuleType, ServiceComponent
+from llama_agents.types import ActionTypes, TaskResult
+
+# bind the enum members once instead of re-resolving them per test
+NEW_TASK = ActionTypes.NEW_TASK
+AGENT = ModuleType.AGENT
+COMPONENT = ModuleType.COMPONENT
+
+TASK_ID = "task123"
+
+# expected TaskDefinition dumps, built once at import and shared between the
+# mocked model_dump and the assertions
+_EXPECTED_AGENT_DATA = {
+    "input": "value",
+    "task_id": TASK_ID,
+    "state": {},
+    "agent_id": None,
+}
+_EXPECTED_COMPONENT_DATA = {
+    "input": "",
+    "task_id": TASK_ID,
+    "state": {"__input_dict__": {"input": "value"}},
+    "agent_id": None,
+}
+
+
+@pytest.fixture(scope="session")
+def _pipeline_template() -> QueryPipeline:
+    # autospec'ing QueryPipeline walks the full class, which is expensive --
+    # build the spec'd mock once per session and hand out copies per test;
+    # instance=True skips building the callable class-mock we never use
+    return create_autospec(QueryPipeline, instance=True)
+
+
+@pytest.fixture()
+def pipeline(_pipeline_template: QueryPipeline) -> QueryPipeline:
+    # a shallow copy shares the spec'd children, so reset call state to keep
+    # per-test assertions like `assert_called_once_with` isolated
+    pipeline = copy.copy(_pipeline_template)
+    pipeline.reset_mock(return_value=True, side_effect=True)
+    return pipeline
+
+
+@pytest.fixture(scope="module")
+def agent_service_component() -> ServiceComponent:
+    return ServiceComponent(
+        name="AgentService",
+        description="A service that wraps an agent",
+        module_type=AGENT,
+    )
+
+
+@pytest.fixture(scope="module")
+def component_service_component() -> ServiceComponent:
+    return ServiceComponent(
+        name="ComponentService",
+        description="A service that wraps a query component",
+        module_type=COMPONENT,
+    )
+
+
+@pytest.fixture(scope="session")
+def task_result() -> TaskResult:
+    # pure data, never mutated -- validate it once per session
+    return TaskResult(task_id="1", history=[], result="output", data={"key": "value"})
+
+
+@pytest.fixture()
+def run_state() -> RunState:
+    # process_component_output only touches module_dict[...].module_type, so a
+    # plain namespace is enough -- no need to validate real pydantic models
+    return cast(
+        RunState,
+        SimpleNamespace(module_dict={"module1": SimpleNamespace(module_type=AGENT)}),
+    )
+
+
+@pytest.fixture()
+def patched_task_definition() -> Iterator[MagicMock]:
+    # plain unittest.mock.patch avoids pytest-mock's per-test bookkeeping
+    with patch("llama_agents.orchestrators.pipeline.TaskDefinition") as mock_td:
+        yield mock_td
+
+
+@pytest.mark.parametrize(
+    ("component_fixture", "expected_data", "expected_call_kwargs", "expected_exc"),
+    [
+        pytest.param(
+            "agent_service_component",
+            _EXPECTED_AGENT_DATA,
+            {"input": "value", "task_id": TASK_ID},
+            None,
+            id="agent",
+        ),
+        pytest.param(
+            "component_service_component",
+            _EXPECTED_COMPONENT_DATA,
+            {
+                "input": "",
+                "task_id": TASK_ID,
+                "state": {"__input_dict__": {"input": "value"}},
+            },
+            None,
+            id="component",
+        ),
+        pytest.param(
+            None,
+            None,
+            None,
+            ValueError,
+            id="invalid-module-type",
+        ),
+    ],
+)
+def test_get_service_component_message(
+    request: pytest.FixtureRequest,
+    patched_task_definition: MagicMock,
+    component_fixture: Optional[str],
+    expected_data: Optional[Dict[str, Any]],
+    expected_call_kwargs: Optional[Dict[str, Any]],
+    expected_exc: Optional[type],
+) -> None:
+    if expected_exc is not None:
+        # a duck-typed stand-in is enough for the bad path (only .module_type
+        # is read before raising) and avoids mutating the shared fixtures
+        component = cast(
+            ServiceComponent,
+            SimpleNamespace(
+                name="AgentService",
+                description="A service that wraps an agent",
+                module_type="INVALID",
+            ),
+        )
+        with pytest.raises(expected_exc, match="Invalid module type"):
+            get_service_component_message(component, TASK_ID, {"input": "value"})
+        return
+
+    assert component_fixture is not None
+    assert expected_call_kwargs is not None
+    component = request.getfixturevalue(component_fixture)
+
+    # a side_effect returning a plain namespace is much cheaper than the
+    # return_value.model_dump.return_value auto-child chain on MagicMock
+    patched_task_definition.side_effect = lambda **kwargs: SimpleNamespace(
+        model_dump=lambda: expected_data
+    )
+
+    message = get_service_component_message(component, TASK_ID, {"input": "value"})
+
+    assert message.type == component.name
+    assert message.action == NEW_TASK
+    assert message.data == expected_data
+    patched_task_definition.assert_called_once_with(**expected_call_kwargs)
+
+
+def test_process_component_output(
+    pipeline: QueryPipeline, run_state: RunState, task_result: TaskResult
+) -> None:
+    process_component_output(pipeline, run_state, "module1", task_result)
+    pipeline.process_component_output.assert_called_once_with(
+        {"output": task_result.result}, "module1", run_state
+    )
+
+    # components propagate the result data as a dict
+    run_state.module_dict["module1"].module_type = COMPONENT
+    pipeline.process_component_output.reset_mock()
+    process_component_output(pipeline, run_state, "module1", task_result)
+    pipeline.process_component_output.assert_called_once_with(
+        task_result.data, "module1", run_state
+    )
+
+    # modules without a module_type attribute are treated as agents
+    delattr(run_state.module_dict["module1"], "module_type")
+    pipeline.process_component_output.reset_mock()
+    process_component_output(pipeline, run_state, "module1", task_result)
+    pipeline.process_component_output.assert_called_once_with(
+        {"output": task_result.result}, "module1", run_state
+    )